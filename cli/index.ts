@@ -16,8 +16,8 @@
  *   hypertoken mcp
  */
 
-import { runRelay } from './commands/relay.js';
-import { runMcp } from './commands/mcp.js';
+// Subcommands are loaded on demand so that e.g. `hypertoken relay` does not
+// pull in the MCP SDK and game modules at startup.
 
 const VERSION = '0.4.0';
 
@@ -69,13 +69,17 @@ async function main(): Promise<void> {
   const commandArgs = args.slice(1);
 
   switch (command) {
-    case 'relay':
+    case 'relay': {
+      const { runRelay } = await import('./commands/relay.js');
       await runRelay(commandArgs);
       break;
+    }
 
-    case 'mcp':
+    case 'mcp': {
+      const { runMcp } = await import('./commands/mcp.js');
       await runMcp(commandArgs);
       break;
+    }
 
     default:
       console.error(`Unknown command: ${command}`);
@@ -5,6 +5,66 @@
 
 import { getBestHandValue, isSoftHand } from '../blackjack-utils.js';
 
+/**
+ * Simplified basic strategy for a single hand
+ * @param {number} agentValue - Best value of the agent's hand
+ * @param {boolean} isSoft - Whether an Ace is counted as 11
+ * @param {number} dealerUpValue - Value of the dealer's face-up card
+ * @returns {string} - "hit" or "stand"
+ */
+function basicStrategy(agentValue, isSoft, dealerUpValue) {
+  // Always stand on 17 or higher
+  if (agentValue >= 17) return "stand";
+  
+  // Soft hands (hands with Ace counted as 11)
+  if (isSoft) {
+    // Soft 18: stand vs 2-8, hit vs 9-A
+    if (agentValue === 18) {
+      return dealerUpValue >= 9 ? "hit" : "stand";
+    }
+    // Soft 19+: always stand
+    if (agentValue >= 19) return "stand";
+    // Soft 17 or less: always hit
+    return "hit";
+  }
+  
+  // Hard hands
+  if (agentValue <= 11) {
+    // Always hit on 11 or less (can't bust)
+    return "hit";
+  }
+  
+  if (agentValue === 12) {
+    // Hit vs 2-3, stand vs 4-6, hit vs 7+
+    if (dealerUpValue <= 3 || dealerUpValue >= 7) return "hit";
+    return "stand";
+  }
+  
+  if (agentValue >= 13 && agentValue <= 16) {
+    // Stand vs 2-6, hit vs 7+
+    if (dealerUpValue >= 7) return "hit";
+    return "stand";
+  }
+  
+  // Default: stand
+  return "stand";
+}
+
+/**
+ * Decision table indexed as [isSoft][agentValue][dealerUpValue], built once
+ * from basicStrategy() so decide() is a lookup instead of a branch cascade.
+ * Hands of 17+ and out-of-range values fall through to basicStrategy().
+ */
+const MAX_TABLE_HAND = 16;
+const MAX_TABLE_DEALER = 11;
+const STRATEGY_TABLE = [false, true].map(isSoft =>
+  Array.from({ length: MAX_TABLE_HAND + 1 }, (_, agentValue) =>
+    Array.from({ length: MAX_TABLE_DEALER + 1 }, (_, dealerUpValue) =>
+      basicStrategy(agentValue, isSoft, dealerUpValue)
+    )
+  )
+);
+
 export class BasicStrategyAgent {
   constructor(name = "BasicBot") {
     this.name = name;
@@ -24,43 +84,8 @@ export class BasicStrategyAgent {
     const dealerUpCard = gameState.dealerHand.cards[1]; // Second card is face up
     const dealerUpValue = dealerUpCard.meta?.value?.[0] || 10;
     
-    // Simplified basic strategy
-    
-    // Always stand on 17 or higher
-    if (agentValue >= 17) return "stand";
-    
-    // Soft hands (hands with Ace counted as 11)
-    if (isSoft) {
-      // Soft 18: stand vs 2-8, hit vs 9-A
-      if (agentValue === 18) {
-        return dealerUpValue >= 9 ? "hit" : "stand";
-      }
-      // Soft 19+: always stand
-      if (agentValue >= 19) return "stand";
-      // Soft 17 or less: always hit
-      return "hit";
-    }
-    
-    // Hard hands
-    if (agentValue <= 11) {
-      // Always hit on 11 or less (can't bust)
-      return "hit";
-    }
-    
-    if (agentValue === 12) {
-      // Hit vs 2-3, stand vs 4-6, hit vs 7+
-      if (dealerUpValue <= 3 || dealerUpValue >= 7) return "hit";
-      return "stand";
-    }
-    
-    if (agentValue >= 13 && agentValue <= 16) {
-      // Stand vs 2-6, hit vs 7+
-      if (dealerUpValue >= 7) return "hit";
-      return "stand";
-    }
-    
-    // Default: stand
-    return "stand";
+    return STRATEGY_TABLE[isSoft ? 1 : 0][agentValue]?.[dealerUpValue]
+      ?? basicStrategy(agentValue, isSoft, dealerUpValue);
   }
 }
 
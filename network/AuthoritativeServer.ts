@@ -27,9 +27,11 @@
  * - Action history for reconnection/replay
  * - Extensible hooks for game-specific logic
  * - Automatic state broadcasting
+ * - Binary protocol support (MessagePack, auto-detected per client)
  */
 import { Emitter } from "../core/events.js";
 import { Engine } from "../engine/Engine.js";
+import { MessageCodec, CodecConfig, jsonCodec } from "./MessageCodec.js";
 import { WebSocketServer, WebSocket } from "ws";
 
 export interface AuthoritativeServerOptions {
@@ -37,12 +39,16 @@ export interface AuthoritativeServerOptions {
   verbose?: boolean;
   /** Automatically broadcast state after each dispatched action */
   broadcastOnAction?: boolean;
+  /** Message codec for binary clients (default: JSON for backward compatibility) */
+  codec?: MessageCodec | Partial<CodecConfig>;
 }
 
 export interface ClientInfo {
   id: string;
   ws: WebSocket;
   connectedAt: number;
+  /** Whether this client uses binary protocol (set on its first MessagePack message) */
+  binaryMode?: boolean;
 }
 
 /** Identity and game context available to the outbound projection policy. */
@@ -81,6 +87,9 @@ export class AuthoritativeServer extends Emitter {
   wss: WebSocketServer | null = null;
   private checkedDispatchesInFlight = 0;
   private dispatchQueue: Promise<void> = Promise.resolve();
+  private codec: MessageCodec;
+  /** Whether binary frames are decoded as MessagePack (msgpack codec only) */
+  private acceptsBinary: boolean;
 
   constructor(engine: Engine, options: AuthoritativeServerOptions = {}) {
     super();
@@ -90,6 +99,16 @@ export class AuthoritativeServer extends Emitter {
     this.broadcastOnAction = options.broadcastOnAction ?? true;
     this.clients = new Map();
 
+    // Setup codec (default to JSON for backward compatibility)
+    if (options.codec instanceof MessageCodec) {
+      this.codec = options.codec;
+    } else if (options.codec) {
+      this.codec = new MessageCodec(options.codec);
+    } else {
+      this.codec = jsonCodec;
+    }
+    this.acceptsBinary = this.codec.getConfig().format === "msgpack";
+
     // Set up default describe if not already set
     if (!this.engine.describe) {
       this.engine.describe = () => this.getState();
@@ -372,6 +391,7 @@ export class AuthoritativeServer extends Emitter {
           id: clientId,
           ws,
           connectedAt: Date.now(),
+          binaryMode: false, // Will be set on first MessagePack message
         };
         this.clients.set(clientId, clientInfo);
 
@@ -387,7 +407,9 @@ export class AuthoritativeServer extends Emitter {
         }, "welcome");
 
         // Handle incoming messages
-        ws.on("message", (data: any) => this.handleMessage(clientId, data));
+        ws.on("message", (data: any, isBinary: boolean) =>
+          this.handleMessage(clientId, data, isBinary)
+        );
 
         // Handle disconnect
         ws.on("close", () => {
@@ -423,9 +445,24 @@ export class AuthoritativeServer extends Emitter {
   // Protocol handling
   // ─────────────────────────────────────────────────────────────
 
-  private async handleMessage(clientId: string, rawData: any): Promise<void> {
+  private async handleMessage(clientId: string, rawData: any, isBinary = false): Promise<void> {
     try {
-      const msg = JSON.parse(rawData.toString());
+      let msg: any;
+      if (isBinary && this.acceptsBinary) {
+        // Binary frames may carry MessagePack or JSON bytes; only switch the
+        // client to binary replies once a MessagePack message decodes cleanly
+        const bytes = this.toBytes(rawData);
+        msg = this.codec.decode(bytes);
+        const client = this.clients.get(clientId);
+        if (client && !client.binaryMode && this.codec.isBinaryEncoded(bytes)) {
+          client.binaryMode = true;
+          if (this.verbose) {
+            console.log(`[AuthServer] Client ${clientId} using binary protocol`);
+          }
+        }
+      } else {
+        msg = JSON.parse(rawData.toString());
+      }
 
       switch (msg.cmd) {
         case "describe":
@@ -595,11 +632,25 @@ export class AuthoritativeServer extends Emitter {
   }
 
   private sendRaw(client: ClientInfo, projected: any): void {
+    if (client.binaryMode) {
+      // Normalize so binary clients see exactly the JSON view (toJSON applied,
+      // functions and undefined dropped) rather than raw object internals
+      const normalized = toJSONValue(projected, "", new Set());
+      if (normalized === undefined) return;
+      client.ws.send(this.codec.encode(normalized));
+      return;
+    }
+    // Use JSON for clients that haven't indicated binary support yet
     const serialized = JSON.stringify(projected);
     if (serialized === undefined) return;
     client.ws.send(serialized);
   }
 
+  private toBytes(data: Buffer | ArrayBuffer | Buffer[]): Uint8Array {
+    if (Array.isArray(data)) return Buffer.concat(data);
+    return data instanceof ArrayBuffer ? new Uint8Array(data) : data;
+  }
+
   private inferOutboundCategory(message: any): OutboundMessageCategory {
     switch (message?.cmd) {
       case "welcome": return "welcome";
@@ -657,3 +708,56 @@ export class AuthoritativeServer extends Emitter {
     return `client-${Date.now()}-${Math.random().toString(36).substring(2, 9)}`;
   }
 }
+
+/**
+ * Produce the value JSON.stringify would serialize, without building the string:
+ * toJSON() is applied, functions/symbols/undefined are dropped from objects and
+ * become null in arrays, and non-finite numbers become null. Returns undefined
+ * where JSON.stringify would emit nothing; throws where it would throw.
+ */
+function toJSONValue(value: unknown, key: string, ancestors: Set<object>): unknown {
+  if ((typeof value === "object" && value !== null) || typeof value === "bigint") {
+    const toJSON = (value as any).toJSON;
+    if (typeof toJSON === "function") value = toJSON.call(value, key);
+  }
+  if (value instanceof Number) value = Number(value);
+  else if (value instanceof String) value = String(value);
+  else if (value instanceof Boolean) value = value.valueOf();
+
+  switch (typeof value) {
+    case "string":
+    case "boolean":
+      return value;
+    case "number":
+      return Number.isFinite(value) ? value : null;
+    case "bigint":
+      throw new TypeError("Do not know how to serialize a BigInt");
+    case "object":
+      break;
+    default:
+      return undefined;
+  }
+  if (value === null) return null;
+
+  const object = value as Record<string, unknown>;
+  if (ancestors.has(object)) throw new TypeError("Converting circular structure to JSON");
+  ancestors.add(object);
+  try {
+    if (Array.isArray(object)) {
+      return Array.from(object, (item, index) => toJSONValue(item, String(index), ancestors) ?? null);
+    }
+    const result: Record<string, unknown> = {};
+    for (const name of Object.keys(object)) {
+      const item = toJSONValue(object[name], name, ancestors);
+      if (item === undefined) continue;
+      if (name === "__proto__") {
+        Object.defineProperty(result, name, { value: item, enumerable: true, configurable: true, writable: true });
+      } else {
+        result[name] = item;
+      }
+    }
+    return result;
+  } finally {
+    ancestors.delete(object);
+  }
+}
@@ -80,6 +80,13 @@ export interface PeerConnectionOptions {
   reconnect?: Partial<ReconnectConfig> | false;
   /** Maximum messages to buffer during reconnection (default: 100) */
   messageBufferSize?: number;
+  /**
+   * Offer permessage-deflate during the handshake (Node 'ws' only, default: false).
+   * Only msgpack codecs deflate large payloads themselves; with the default
+   * jsonCodec, peers lose compression against servers that accept the offer.
+   * Enable this for JSON peers on bandwidth-constrained links.
+   */
+  perMessageDeflate?: boolean;
 }
 
 /**
@@ -107,6 +114,7 @@ export class PeerConnection extends Emitter {
 
   private codec: MessageCodec;
   private binaryMode: boolean;
+  private perMessageDeflate: boolean;
 
   // Reconnection state
   private reconnectConfig: ReconnectConfig;
@@ -147,6 +155,7 @@ export class PeerConnection extends Emitter {
     }
 
     this.messageBufferSize = options.messageBufferSize ?? 100;
+    this.perMessageDeflate = options.perMessageDeflate ?? false;
   }
 
   /**
@@ -173,10 +182,14 @@ export class PeerConnection extends Emitter {
       : ConnectionState.Connecting;
 
     // Check for Node's 'ws' constructor (Ws.WebSocket) first, otherwise fall back to browser global
-    const WS = typeof Ws.WebSocket !== "undefined" ? Ws.WebSocket : (global as any).WebSocket;
+    const isNodeWs = typeof Ws.WebSocket !== "undefined";
+    const WS = isNodeWs ? Ws.WebSocket : (global as any).WebSocket;
 
     try {
-      this.socket = new WS(this.url);
+      // 'ws' already sets TCP_NODELAY on its sockets; only the deflate offer needs turning off
+      this.socket = isNodeWs
+        ? new WS(this.url, { perMessageDeflate: this.perMessageDeflate })
+        : new WS(this.url);
     } catch (err) {
       console.error("[PeerConnection] Failed to create WebSocket:", err);
       this._scheduleReconnect();
@@ -206,12 +219,22 @@ export class PeerConnection extends Emitter {
 
   /**
    * Disconnect and don't reconnect
+   *
+   * @param graceful - Perform the WebSocket closing handshake (default: true).
+   *   Pass false for fast teardown: on Node ('ws') the socket is destroyed
+   *   immediately instead of waiting for the peer's close frame. Browser
+   *   WebSockets have no such option and always close gracefully.
    */
-  disconnect(): void {
+  disconnect(graceful: boolean = true): void {
     this.intentionalClose = true;
     this._cancelReconnect();
     if (this.socket) {
-      this.socket.close(1000, "Client disconnect");
+      const terminate = (this.socket as any).terminate;
+      if (!graceful && typeof terminate === "function") {
+        terminate.call(this.socket);
+      } else {
+        this.socket.close(1000, "Client disconnect");
+      }
     }
     this.connectionState = ConnectionState.Disconnected;
   }
@@ -519,14 +519,18 @@ export class UniversalRelayServer extends Emitter {
     const room = this.rooms.get(roomCode);
     if (!room) return;
 
-    const jsonStr = JSON.stringify(msg);
+    // Encode lazily, at most once per wire format, rather than once per peer
+    let jsonStr: string | null = null;
+    let encoded: Uint8Array | string | null = null;
     for (const client of room) {
       if (client !== excludeWs && client.readyState === WebSocket.OPEN) {
         const info = this.clients.get(client);
         if (info) {
           if (info.binaryMode) {
-            client.send(this.codec.encode(msg));
+            encoded ??= this.codec.encode(msg);
+            client.send(encoded);
           } else {
+            jsonStr ??= JSON.stringify(msg);
             client.send(jsonStr);
           }
         }
@@ -579,20 +583,21 @@ export class UniversalRelayServer extends Emitter {
       // Sender is not in a room — broadcast to non-room peers only (backward compat)
     }
 
-    // Pre-encode for efficiency
-    const jsonStr = JSON.stringify(msg);
-    const binaryData = this.codec.getConfig().format === "msgpack"
-      ? this.codec.encode(msg) as Uint8Array
-      : null;
+    // Encode lazily and share across recipients
+    const useBinary = this.codec.getConfig().format === "msgpack";
+    let jsonStr: string | null = null;
+    let binaryData: Uint8Array | null = null;
 
     for (const [client, info] of this.clients) {
       if (client !== excludeWs && client.readyState === WebSocket.OPEN) {
         // Skip peers in rooms (they only receive room-scoped broadcasts)
         if (this.roomsEnabled && this.peerRooms.has(info.peerId)) continue;
 
-        if (info.binaryMode && binaryData) {
+        if (info.binaryMode && useBinary) {
+          binaryData ??= this.codec.encode(msg) as Uint8Array;
           client.send(binaryData);
         } else {
+          jsonStr ??= JSON.stringify(msg);
           client.send(jsonStr);
         }
       }
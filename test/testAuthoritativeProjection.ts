@@ -9,6 +9,7 @@ import {
   OutboundPrincipal,
 } from "../network/AuthoritativeServer.js";
 import { RoomAuthoritativeServer } from "../network/RoomAuthoritativeServer.js";
+import { defaultCodec } from "../network/MessageCodec.js";
 
 const SECRET = "SECRET-CANARY-authoritative-projection";
 
@@ -23,11 +24,17 @@ function sleep(ms: number): Promise<void> {
 class TestClient {
   readonly ws: WebSocket;
   private messages: any[] = [];
+  binaryFrames = 0;
 
   constructor(url: string) {
     this.ws = new WebSocket(url);
-    this.ws.on("message", (data) => {
-      this.messages.push(JSON.parse(data.toString()));
+    this.ws.on("message", (data, isBinary) => {
+      if (isBinary) {
+        this.binaryFrames++;
+        this.messages.push(defaultCodec.decode(new Uint8Array(data as Buffer)));
+      } else {
+        this.messages.push(JSON.parse(data.toString()));
+      }
     });
   }
 
@@ -43,6 +50,10 @@ class TestClient {
     this.ws.send(JSON.stringify(message));
   }
 
+  sendBinary(message: any): void {
+    this.ws.send(defaultCodec.encode(message));
+  }
+
   async waitFor(predicate: (message: any) => boolean, timeoutMs = 2000): Promise<any> {
     const deadline = Date.now() + timeoutMs;
     while (Date.now() < deadline) {
@@ -324,6 +335,124 @@ async function main(): Promise<void> {
     }
   });
 
+  await test("replies to binary clients with MessagePack projections", async () => {
+    const engine = new Engine();
+    const server = new ProjectionServer(engine, { port: 0, verbose: false, codec: { format: "msgpack" } });
+    await server.start();
+    const binary = new TestClient(urlFor(server));
+    const text = new TestClient(urlFor(server));
+
+    try {
+      await Promise.all([binary.open(), text.open()]);
+      const welcome = await binary.waitFor((message) => message.cmd === "welcome");
+      await text.waitFor((message) => message.cmd === "welcome");
+      assert(binary.binaryFrames === 0, "welcome was not sent as JSON before negotiation");
+
+      binary.sendBinary({ cmd: "describe" });
+      const described = await binary.waitFor((message) => message.cmd === "state");
+      assert(described.state.viewer === welcome.clientId, "binary describe used wrong client projection");
+      assert(binary.binaryFrames === 1, "binary client did not receive a MessagePack reply");
+
+      binary.sendBinary({ cmd: "dispatch", type: "game:setProperty", payload: { key: "k", value: 1 }, requestId: "bin-1" });
+      const acknowledgement = await binary.waitFor(
+        (message) => message.cmd === "dispatch:result" && message.requestId === "bin-1"
+      );
+      assert(acknowledgement.ok === true, "binary dispatch was not acknowledged");
+      await text.waitFor((message) => message.cmd === "state");
+      assert(text.binaryFrames === 0, "JSON client received binary frames");
+    } finally {
+      binary.close();
+      text.close();
+      server.stop();
+    }
+  });
+
+  await test("binary clients receive the same JSON-normalized view as text clients", async () => {
+    class RedactingServer extends AuthoritativeServer {
+      protected override getStateForClient(clientId: string): any {
+        return {
+          viewer: clientId,
+          board: {
+            zones: { public: [1], _lock: [SECRET] },
+            toJSON() {
+              return { zones: { public: this.zones.public } };
+            },
+          },
+          omitted: undefined,
+          reveal: () => SECRET,
+        };
+      }
+    }
+
+    const engine = new Engine();
+    const server = new RedactingServer(engine, { port: 0, verbose: false, codec: { format: "msgpack" } });
+    await server.start();
+    const binary = new TestClient(urlFor(server));
+    const text = new TestClient(urlFor(server));
+
+    try {
+      await Promise.all([binary.open(), text.open()]);
+      await binary.waitFor((message) => message.cmd === "welcome");
+      await text.waitFor((message) => message.cmd === "welcome");
+
+      // JSON bytes in a binary frame must not switch the client to MessagePack
+      binary.ws.send(Buffer.from(JSON.stringify({ cmd: "describe" })));
+      await binary.waitFor((message) => message.cmd === "state");
+      assert(binary.binaryFrames === 0, "JSON payload in a binary frame enabled binary replies");
+
+      text.send({ cmd: "describe" });
+      binary.sendBinary({ cmd: "describe" });
+      const textState = await text.waitFor((message) => message.cmd === "state");
+      const binaryState = await binary.waitFor((message) => message.cmd === "state");
+      assert(binary.binaryFrames === 1, "binary client did not receive a MessagePack reply");
+      assert(
+        JSON.stringify(binaryState.state.board) === JSON.stringify(textState.state.board),
+        "binary projection diverged from the JSON projection"
+      );
+      assert(JSON.stringify(binaryState.state.board) === '{"zones":{"public":[1]}}', "toJSON was not applied");
+      assert(!("omitted" in binaryState.state), "undefined field was encoded for binary client");
+      assert(!("reveal" in binaryState.state), "function field was encoded for binary client");
+      assertNoCanary([binaryState, textState], "binary toJSON state");
+    } finally {
+      binary.close();
+      text.close();
+      server.stop();
+    }
+  });
+
+  await test("default-codec server answers text and Buffer-JSON clients with JSON", async () => {
+    const engine = new Engine();
+    const server = new ProjectionServer(engine, { port: 0, verbose: false });
+    await server.start();
+    const text = new TestClient(urlFor(server));
+    const buffer = new TestClient(urlFor(server));
+
+    try {
+      await Promise.all([text.open(), buffer.open()]);
+      const textWelcome = await text.waitFor((message) => message.cmd === "welcome");
+      const bufferWelcome = await buffer.waitFor((message) => message.cmd === "welcome");
+
+      text.send({ cmd: "describe" });
+      // Leading whitespace: valid JSON that does not start with '{'
+      buffer.ws.send(Buffer.from(`\n  ${JSON.stringify({ cmd: "describe" })}`));
+      const textState = await text.waitFor((message) => message.cmd === "state");
+      const bufferState = await buffer.waitFor((message) => message.cmd === "state");
+      assert(textState.state.viewer === textWelcome.clientId, "text client got wrong projection");
+      assert(bufferState.state.viewer === bufferWelcome.clientId, "Buffer-JSON client got wrong projection");
+
+      // MessagePack is not accepted without a msgpack codec
+      buffer.sendBinary({ cmd: "describe" });
+      const rejected = await buffer.waitFor((message) => message.cmd === "error");
+      assert(rejected.message === "Invalid message", "msgpack frame was not rejected by a JSON server");
+
+      assert(text.binaryFrames === 0 && buffer.binaryFrames === 0, "default-codec server sent binary frames");
+    } finally {
+      text.close();
+      buffer.close();
+      server.stop();
+    }
+  });
+
   await test("projects and fail-closes room create/join/left/list/errors", async () => {
     const server = new ProjectionRoomServer();
     await server.start();
@@ -10,10 +10,14 @@
  * 4. Automerge proxy issue (Object.values() on proxies)
  * 5. Engine.connect() + sync
  * 6. StateSyncManager (verify it's dead code)
+ * 7. Remote sync source field
+ * 8. PeerConnection transport options
  */
 import { Engine } from "../engine/Engine.js";
 import { Chronicle } from "../core/Chronicle.js";
 import { UniversalRelayServer } from "../network/UniversalRelayServer.js";
+import { PeerConnection } from "../network/PeerConnection.js";
+import { WebSocketServer } from "ws";
 
 let passed = 0;
 let failed = 0;
@@ -425,6 +429,71 @@ async function runTests(): Promise<void> {
     await sleep(200);
   });
 
+  // ========================================================================
+  // 8. PeerConnection transport options
+  // ========================================================================
+  console.log("\n── PeerConnection Transport ──\n");
+
+  await runTest("PeerConnection offers permessage-deflate only when enabled", async () => {
+    const wss = new WebSocketServer({ port: 9309, perMessageDeflate: true });
+    const offers: Array<string | undefined> = [];
+    wss.on("connection", (_ws, req) => {
+      offers.push(req.headers["sec-websocket-extensions"]);
+    });
+
+    const plain = new PeerConnection("ws://localhost:9309", null, { reconnect: false });
+    const deflating = new PeerConnection("ws://localhost:9309", null, {
+      reconnect: false,
+      perMessageDeflate: true,
+    });
+
+    plain.connect();
+    await sleep(300);
+    deflating.connect();
+    await sleep(300);
+
+    assert(offers.length === 2, `Expected 2 connections, got ${offers.length}`);
+    assert(offers[0] === undefined, `Default client should not offer deflate, offered '${offers[0]}'`);
+    assert(
+      offers[1]?.includes("permessage-deflate") === true,
+      `Opted-in client should offer deflate, offered '${offers[1]}'`,
+    );
+
+    plain.disconnect();
+    deflating.disconnect();
+    wss.close();
+    await sleep(200);
+  });
+
+  await runTest("disconnect(false) terminates without scheduling a reconnect", async () => {
+    const server = new UniversalRelayServer({ port: 9310, verbose: false });
+    await server.start();
+
+    const peer = new PeerConnection("ws://localhost:9310", null, {
+      reconnect: { initialDelay: 50, jitter: false },
+    });
+    const disconnects: any[] = [];
+    let reconnecting = 0;
+    peer.on("net:disconnected", (e: any) => disconnects.push(e.payload));
+    peer.on("net:reconnecting", () => { reconnecting++; });
+
+    peer.connect();
+    await sleep(300);
+    assert(peer.connected, "Peer should be connected before terminating");
+
+    // terminate() closes with 1006; only intentionalClose keeps it from reconnecting
+    peer.disconnect(false);
+    await sleep(300);
+
+    assert(disconnects.length === 1, `Expected 1 net:disconnected, got ${disconnects.length}`);
+    assert(disconnects[0].intentional === true, "Terminated disconnect should be intentional");
+    assert(reconnecting === 0, `Expected no net:reconnecting, got ${reconnecting}`);
+    assert(!peer.connected, "Peer should stay disconnected");
+
+    server.stop();
+    await sleep(200);
+  });
+
   // Summary
   console.log(`\n${passed} passed, ${failed} failed`);
   if (failed > 0) process.exit(1);